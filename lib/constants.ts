@@ -123,3 +123,46 @@ export const ELASTICACHE_FAMILY_CACHE_SIZE = Number.parseInt(
   process.env.ELASTICACHE_FAMILY_CACHE_SIZE ?? '256',
   10,
 )
+
+/**
+ * Directory used to cache fetched AWS documentation pages on disk.
+ *
+ * This constant is derived from the `AWS_DOCS_CACHE_DIR` environment variable.
+ * If not set, the on-disk cache is disabled and every fetch hits the network.
+ *
+ * @example
+ * ```typescript
+ * // Disabled by default
+ * import { AWS_DOCS_CACHE_DIR } from 'aws-instance-info'
+ * console.log(AWS_DOCS_CACHE_DIR) // ''
+ *
+ * // Or set via environment variable:
+ * // AWS_DOCS_CACHE_DIR=.cache/aws-docs node app.js
+ * ```
+ */
+export const AWS_DOCS_CACHE_DIR = process.env.AWS_DOCS_CACHE_DIR ?? ''
+
+// A NaN TTL would make every cached page look fresh forever
+function parseCacheTtl(value: string | undefined): number {
+  const seconds = Number.parseInt(value ?? '86400', 10)
+  return Number.isNaN(seconds) ? 86400 : seconds
+}
+
+/**
+ * Maximum age, in seconds, of a cached AWS documentation page before it is
+ * fetched again.
+ *
+ * This constant is derived from the `AWS_DOCS_CACHE_TTL` environment variable.
+ * If not set or not a number, defaults to 86400 (one day).
+ *
+ * @example
+ * ```typescript
+ * // Use default TTL (86400)
+ * import { AWS_DOCS_CACHE_TTL } from 'aws-instance-info'
+ * console.log(AWS_DOCS_CACHE_TTL) // 86400
+ *
+ * // Or set via environment variable:
+ * // AWS_DOCS_CACHE_TTL=3600 node app.js
+ * ```
+ */
+export const AWS_DOCS_CACHE_TTL = parseCacheTtl(process.env.AWS_DOCS_CACHE_TTL)
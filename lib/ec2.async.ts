@@ -40,15 +40,12 @@ async function ensureInitialized(): Promise<void> {
   initPromise = (async () => {
     const all = await fetchAllEC2()
 
-    // Populate instance cache and full map
+    // Populate instance cache and full map, and build family data in one pass
+    const builtFamilyMap = new Map<string, EC2FamilyData>()
     for (const instance of all) {
       instanceCache.set(instance.instanceType, instance)
       instanceMap.set(instance.instanceType, instance)
-    }
 
-    // Build family data from instances
-    const builtFamilyMap = new Map<string, EC2FamilyData>()
-    for (const instance of all) {
       const { family, category } = instance
       let fd = builtFamilyMap.get(family)
       if (!fd) {
@@ -47,15 +47,12 @@ async function ensureInitialized(): Promise<void> {
   initPromise = (async () => {
     const all = await fetchElastiCacheNodes()
 
-    // Populate node cache and full map
+    // Populate node cache and full map, and build family data in one pass
+    const builtFamilyMap = new Map<string, ElastiCacheFamilyData>()
     for (const node of all) {
       nodeCache.set(node.nodeType, node)
       nodeMap.set(node.nodeType, node)
-    }
 
-    // Build family data from nodes
-    const builtFamilyMap = new Map<string, ElastiCacheFamilyData>()
-    for (const node of all) {
       const { family, category } = node
       let fd = builtFamilyMap.get(family)
       if (!fd) {
@@ -1,4 +1,15 @@
-import { parse } from 'node-html-parser'
+import { createHash, randomUUID } from 'node:crypto'
+import {
+  mkdir,
+  readFile,
+  rename,
+  rm,
+  stat,
+  writeFile,
+} from 'node:fs/promises'
+import { join } from 'node:path'
+import { type HTMLElement, parse } from 'node-html-parser'
+import { AWS_DOCS_CACHE_DIR, AWS_DOCS_CACHE_TTL } from './constants.js'
 import type {
   BandwidthSpec,
   EC2EBSSpec,
@@ -47,58 +58,108 @@ export const ELASTICACHE_CATEGORIES = [
   'burstable_performance',
 ]
 
+// === String Interning ===
+
+// Enum-like values (hypervisors, processors, families, network and bandwidth
+// labels) repeat across the rows of a page; keep one shared string per
+// distinct value. Each process*Data call builds its own pool so nothing
+// outlives the parsed data: cell text is sliced from the page string, and a
+// module-level pool would keep that markup alive for the life of the process.
+function createInterner(): (value: string) => string {
+  const pool = new Map<string, string>()
+  return value => {
+    const pooled = pool.get(value)
+    if (pooled !== undefined) return pooled
+    pool.set(value, value)
+    return value
+  }
+}
+
 // === Text Cleaning ===
 
+// Patterns are hoisted so each cell reuses one RegExp instead of
+// re-evaluating a literal per call.
+const NON_PRINTABLE_RE = /[^\u0020-\u007E]/g
+const WHITESPACE_RE = /\s+/g
+const INSTANCE_SUFFIX_RE =
+  /(\d*xlarge|metal(?:-\d+xl)?|nano|micro|small|medium|large)\d+$/
+const HYPERVISOR_STAR_RE = /\s*[*]+\s*$/
+const OS_TRAILING_DIGITS_RE = /\d+$/
+const OS_PAREN_RE = /\s*\([^)]*\)\s*$/
+const TRAILING_STAR_RE = /[*]+$/
+const SNAKE_CHAR_RE = /[().\/\s-]/g
+const SNAKE_UNDERSCORE_RE = /_+/g
+const SNAKE_EDGE_RE = /^_|_$/g
+
 function cleanText(text: string): string {
   // Remove non-ASCII and clean whitespace
-  const cleaned = text.replace(/[^\u0020-\u007E]/g, '')
-  return cleaned.replace(/\s+/g, ' ').trim()
+  const cleaned = text.replace(NON_PRINTABLE_RE, '')
+  // Tabs and newlines are already stripped above, so only runs of spaces
+  // need collapsing; most single-line cells skip the regex entirely
+  if (!cleaned.includes('  ')) return cleaned.trim()
+  return cleaned.replace(WHITESPACE_RE, ' ').trim()
 }
 
 function cleanInstanceType(instanceType: string): string {
-  return instanceType.replace(
-    /(\d*xlarge|metal(?:-\d+xl)?|nano|micro|small|medium|large)\d+$/,
-    '$1',
-  )
+  return instanceType.replace(INSTANCE_SUFFIX_RE, '$1')
 }
 
 function cleanHypervisor(hypervisor: string): string {
-  return hypervisor.replace(/\s*[*]+\s*$/, '').trim()
+  return hypervisor.replace(HYPERVISOR_STAR_RE, '').trim()
+}
+
+function cleanOperatingSystemName(val: string): string {
+  return val.replace(OS_TRAILING_DIGITS_RE, '').replace(OS_PAREN_RE, '').trim()
 }
 
 function cleanOperatingSystem(osValue: string | string[]): string[] {
-  function cleanSingle(val: string): string {
-    let s = val.replace(/\d+$/, '')
-    s = s.replace(/\s*\([^)]*\)\s*$/, '')
-    return s.trim()
-  }
-  if (typeof osValue === 'string') return [cleanSingle(osValue)]
-  return osValue.map(cleanSingle)
+  if (typeof osValue === 'string') return [cleanOperatingSystemName(osValue)]
+  return osValue.map(cleanOperatingSystemName)
 }
 
+// Parens and dots are dropped; slashes, whitespace and hyphens become "_"
+const SNAKE_CHAR_MAP: Record<string, string> = { '(': '', ')': '', '.': '' }
+
+// Header vocabulary is small and repeats across every table and page
+const snakeCaseCache = new Map<string, string>()
+
 function toSnakeCase(text: string): string {
-  let t = text.replace(/[().]/g, '')
-  t = t.replace(/\//g, '_')
-  t = t.replace(/[\s-]+/g, '_')
-  t = t.toLowerCase()
-  t = t.replace(/_+/g, '_')
-  return t.replace(/^_|_$/g, '')
+  const cached = snakeCaseCache.get(text)
+  if (cached !== undefined) return cached
+  const result = text
+    .replace(SNAKE_CHAR_RE, c => SNAKE_CHAR_MAP[c] ?? '_')
+    .toLowerCase()
+    .replace(SNAKE_UNDERSCORE_RE, '_')
+    .replace(SNAKE_EDGE_RE, '')
+  snakeCaseCache.set(text, result)
+  return result
 }
 
 // === Value Parsing ===
 
 type BasicValue = string | number | boolean | string[]
 
+const YES_NO = new Map([
+  ['yes', true],
+  ['no', false],
+])
+
 function parseBasicValue(value: string): BasicValue {
   if (!value) return value
-  if (value.toLowerCase() === 'yes') return true
-  if (value.toLowerCase() === 'no') return false
+  // Cells are printable ASCII, so only 2-3 char values can be yes/no
+  if (value.length <= 3) {
+    const flag = YES_NO.get(value.toLowerCase())
+    if (flag !== undefined) return flag
+  }
   if (value.includes('|')) {
     return value
       .split('|')
       .map(s => s.trim())
       .filter(s => s.length > 0)
   }
+  // Only values starting with "-" or a digit can round-trip as numbers
+  const first = value.charCodeAt(0)
+  if (first !== 45 && (first < 48 || first > 57)) return value
   if (value.includes('.')) {
     const f = Number.parseFloat(value)
     if (!Number.isNaN(f) && String(f) === value) return f
@@ -109,6 +170,13 @@ function parseBasicValue(value: string): BasicValue {
   return value
 }
 
+// Index of the only "/" in value, or -1 when there is none or more than one
+function singleSlashIndex(value: string): number {
+  const slash = value.indexOf('/')
+  if (slash === -1 || value.indexOf('/', slash + 1) !== -1) return -1
+  return slash
+}
+
 function parseBandwidth(value: string | number): BandwidthSpec | string {
   if (typeof value === 'number') {
     return { baseline: value, burst: null }
@@ -117,26 +185,25 @@ function parseBandwidth(value: string | number): BandwidthSpec | string {
     return { baseline: null, burst: null }
   }
   // Handle "X / Y" format (not Gigabit descriptive strings)
-  if (value.includes('/') && !value.includes('Gigabit')) {
-    const parts = value.split('/')
-    if (parts.length === 2) {
-      const part0 = parts[0] ?? ''
-      const part1 = parts[1] ?? ''
-      const baseline = Number.parseFloat(part0.trim())
-      const burst = Number.parseFloat(part1.trim())
-      if (!Number.isNaN(baseline) && !Number.isNaN(burst)) {
-        return { baseline, burst }
-      }
+  const slash = singleSlashIndex(value)
+  if (slash !== -1 && !value.includes('Gigabit')) {
+    // parseFloat skips leading and stops at trailing whitespace
+    const baseline = Number.parseFloat(value.slice(0, slash))
+    const burst = Number.parseFloat(value.slice(slash + 1))
+    if (!Number.isNaN(baseline) && !Number.isNaN(burst)) {
+      return { baseline, burst }
     }
   }
   return value
 }
 
+const VOLUME_LIMIT_RE = /(?:Up to\s+)?(\d+)\s*\((\w+)(?:[- ]based)?\s*limit\)/i
+
 function parseVolumeLimit(value: string): VolumeLimitSpec | string {
   if (typeof value !== 'string') return value
-  const match = value.match(
-    /(?:Up to\s+)?(\d+)\s*\((\w+)(?:[- ]based)?\s*limit\)/i,
-  )
+  // Cheap pre-check: the pattern needs a "(" to match
+  if (!value.includes('(')) return value
+  const match = value.match(VOLUME_LIMIT_RE)
   if (match) {
     const limitStr = match[1] ?? ''
     const limitType = match[2] ?? ''
@@ -151,72 +218,178 @@ function parseVolumeLimit(value: string): VolumeLimitSpec | string {
 }
 
 function parseIops(value: string): [string, string] {
-  if (typeof value !== 'string' || !value.includes('/')) {
-    return [value ?? '', '']
-  }
-  const parts = value.split('/')
-  const part0 = parts[0] ?? ''
-  const part1 = parts[1] ?? ''
-  if (parts.length === 2) {
-    return [part0.trim(), part1.trim()]
-  }
-  return [value, '']
+  if (typeof value !== 'string') return [value ?? '', '']
+  const slash = singleSlashIndex(value)
+  if (slash === -1) return [value, '']
+  return [value.slice(0, slash).trim(), value.slice(slash + 1).trim()]
 }
 
 // === Family Extraction ===
 
+function capitalizeFirst(text: string): string {
+  return text.charAt(0).toUpperCase() + text.slice(1)
+}
+
+// Dot-delimited segment starting at `start`, without allocating a split array
+function segmentFrom(value: string, start: number): string {
+  const end = value.indexOf('.', start)
+  return end === -1 ? value.slice(start) : value.slice(start, end)
+}
+
 export function extractFamilyFromInstanceType(instanceType: string): string {
-  const parts = instanceType.split('.')
-  const familyPart = parts[0] ?? instanceType
+  const familyPart = segmentFrom(instanceType, 0)
   if (!familyPart) return instanceType
-  return familyPart.charAt(0).toUpperCase() + familyPart.slice(1)
+  return capitalizeFirst(familyPart)
 }
 
 export function extractRDSFamily(instanceClass: string): string {
   if (instanceClass.startsWith('db.')) {
-    const parts = instanceClass.slice(3).split('.')
-    const first = parts[0]
-    if (first) return first.charAt(0).toUpperCase() + first.slice(1)
+    const first = segmentFrom(instanceClass, 3)
+    if (first) return capitalizeFirst(first)
   }
   return instanceClass
 }
 
 export function extractElastiCacheFamily(nodeType: string): string {
   if (nodeType.startsWith('cache.')) {
-    const parts = nodeType.slice(6).split('.')
-    const first = parts[0]
-    if (first) return first.charAt(0).toUpperCase() + first.slice(1)
+    const first = segmentFrom(nodeType, 6)
+    if (first) return capitalizeFirst(first)
   }
   return nodeType
 }
 
 // === Category Determination ===
 
+// Categories keyed by the lowercased first letter of the family name
+const RDS_CATEGORY_BY_PREFIX: Record<string, string> = {
+  t: 'burstable_performance',
+  r: 'memory_optimized',
+  x: 'memory_optimized',
+  z: 'memory_optimized',
+  c: 'compute_optimized',
+}
+
+const ELASTICACHE_CATEGORY_BY_PREFIX: Record<string, string> = {
+  t: 'burstable_performance',
+  r: 'memory_optimized',
+  c: 'network_optimized',
+}
+
 export function determineRDSCategory(family: string): string {
-  const f = family.toLowerCase()
-  if (f.startsWith('t')) return 'burstable_performance'
-  if (f.startsWith('r') || f.startsWith('x') || f.startsWith('z'))
-    return 'memory_optimized'
-  if (f.startsWith('c')) return 'compute_optimized'
-  return 'general_purpose'
+  const prefix = family.charAt(0).toLowerCase()
+  return RDS_CATEGORY_BY_PREFIX[prefix] ?? 'general_purpose'
 }
 
 export function determineElastiCacheCategory(family: string): string {
-  const f = family.toLowerCase()
-  if (f.startsWith('t')) return 'burstable_performance'
-  if (f.startsWith('r')) return 'memory_optimized'
-  if (f.startsWith('c')) return 'network_optimized'
-  return 'general_purpose'
+  const prefix = family.charAt(0).toLowerCase()
+  return ELASTICACHE_CATEGORY_BY_PREFIX[prefix] ?? 'general_purpose'
 }
 
 // === HTML Table Parsing ===
 
+// Only <table> content is read from a docs page. Script and style bodies are
+// scanned past without building text nodes; <pre> keeps the default handling.
+const PAGE_PARSE_OPTIONS: Parameters<typeof parse>[1] = {
+  blockTextElements: {
+    script: false,
+    noscript: false,
+    style: false,
+    pre: true,
+  },
+}
+
+// Comments and script/style/noscript bodies are matched whole (to the end of
+// the page if unterminated) so a "<table" inside them is never counted. Group 2
+// is only set for real table tags: "" when opening, "/" when closing.
+const TABLE_TAG_RE =
+  /<!--[\s\S]*?(?:-->|$)|<(script|style|noscript)\b[\s\S]*?(?:<\/\1\s*>|$)|<(\/?)table\b/gi
+
+/**
+ * Cut the top-level <table>...</table> blocks out of a page so only they are
+ * handed to the HTML parser; nav, sidebar and footer markup never becomes
+ * DOM nodes. Nested tables stay inside their parent block, and tables inside
+ * comments or script text are ignored, as the full-page parse would.
+ */
+function extractTableMarkup(html: string): string {
+  const blocks: string[] = []
+  let depth = 0
+  let start = 0
+  for (const match of html.matchAll(TABLE_TAG_RE)) {
+    const slash = match[2]
+    if (slash === undefined) continue
+    const at = match.index ?? 0
+    if (!slash) {
+      if (depth === 0) start = at
+      depth++
+    } else if (depth > 0) {
+      depth--
+      if (depth === 0) {
+        const end = html.indexOf('>', at)
+        blocks.push(html.slice(start, end === -1 ? html.length : end + 1))
+      }
+    }
+  }
+  // Unclosed trailing table: keep the rest and let the parser recover
+  if (depth > 0) blocks.push(html.slice(start))
+  return blocks.join('\n')
+}
+
 type RawRow = Record<string, BasicValue>
 
-function parseTable(tableHtml: string): RawRow[] {
-  const root = parse(tableHtml)
-  const table = root.querySelector('table') ?? root
+type CellCleaner = (value: BasicValue) => BasicValue
+
+interface TableOptions {
+  /** Coerce cell text with parseBasicValue before cleaning */
+  parseValues: boolean
+  /** Per-header cleaners, keyed by snake_case header name */
+  cleaners: Map<string, CellCleaner>
+  /** Whether a parsed row belongs in the output */
+  keepRow: (row: RawRow) => boolean
+}
+
+const stripTrailingStars: CellCleaner = value =>
+  typeof value === 'string' ? value.replace(TRAILING_STAR_RE, '').trim() : value
+
+const EC2_TABLE: TableOptions = {
+  parseValues: true,
+  cleaners: new Map<string, CellCleaner>([
+    [
+      'instance_type',
+      value => (typeof value === 'string' ? cleanInstanceType(value) : value),
+    ],
+    [
+      'hypervisor',
+      value => (typeof value === 'string' ? cleanHypervisor(value) : value),
+    ],
+    [
+      'supported_operating_systems',
+      value =>
+        cleanOperatingSystem(Array.isArray(value) ? value : String(value)),
+    ],
+  ]),
+  keepRow: row => Object.keys(row).length > 1,
+}
+
+const RDS_TABLE: TableOptions = {
+  parseValues: false,
+  cleaners: new Map([['instance_class', stripTrailingStars]]),
+  keepRow: row => Boolean(getRawAny(row, 'instance_class')),
+}
+
+const ELASTICACHE_TABLE: TableOptions = {
+  parseValues: false,
+  cleaners: new Map([
+    ['node_type', stripTrailingStars],
+    ['instance_type', stripTrailingStars],
+  ]),
+  keepRow: row => elastiCacheNodeType(row).startsWith('cache.'),
+}
 
+/**
+ * Parse an already-parsed <table> element into one row object per <tr>.
+ * Rows without <td> cells or rejected by `options.keepRow` are skipped.
+ */
+function parseTable(table: HTMLElement, options: TableOptions): RawRow[] {
   // Extract headers from thead
   const headers: string[] = []
   const thead = table.querySelector('thead')
@@ -225,13 +398,12 @@ function parseTable(tableHtml: string): RawRow[] {
       headers.push(toSnakeCase(cleanText(th.text)))
     }
   }
+  // Resolve each column's cleaner once per table instead of once per cell
+  const columnCleaners = headers.map(header => options.cleaners.get(header))
 
   const rows: RawRow[] = []
   const tbody = table.querySelector('tbody') ?? table
-  const trs = tbody.querySelectorAll('tr')
-  for (let ri = 0; ri < trs.length; ri++) {
-    const tr = trs[ri]
-    if (!tr) continue
+  for (const tr of tbody.querySelectorAll('tr')) {
     const cells = tr.querySelectorAll('td')
     if (!cells.length) continue
 
@@ -239,26 +411,17 @@ function parseTable(tableHtml: string): RawRow[] {
     for (let i = 0; i < cells.length; i++) {
       const cell = cells[i]
       if (!cell) continue
-      let value: BasicValue = cleanText(cell.text)
-      value = parseBasicValue(value as string)
-
-      const header =
-        i < headers.length ? (headers[i] ?? `column_${i}`) : `column_${i}`
-
-      if (header === 'instance_type' && typeof value === 'string') {
-        value = cleanInstanceType(value)
-      } else if (header === 'hypervisor' && typeof value === 'string') {
-        value = cleanHypervisor(value)
-      } else if (header === 'supported_operating_systems') {
-        value = cleanOperatingSystem(
-          Array.isArray(value) ? value : String(value),
-        )
-      }
+      const text = cleanText(cell.text)
+      let value: BasicValue = options.parseValues ? parseBasicValue(text) : text
+
+      const header = headers[i] ?? `column_${i}`
+      const cleaner = columnCleaners[i]
+      if (cleaner) value = cleaner(value)
 
       rowData[header] = value
     }
 
-    if (Object.keys(rowData).length > 1) {
+    if (options.keepRow(rowData)) {
       rows.push(rowData)
     }
   }
@@ -266,6 +429,15 @@ function parseTable(tableHtml: string): RawRow[] {
   return rows
 }
 
+/**
+ * Parse every <table> on a docs page, returning one row list per table in
+ * document order.
+ */
+function parseTables(html: string, options: TableOptions): RawRow[][] {
+  const root = parse(extractTableMarkup(html), PAGE_PARSE_OPTIONS)
+  return root.querySelectorAll('table').map(table => parseTable(table, options))
+}
+
 // === EC2 Parsing ===
 
 interface EC2CategoryPageData {
@@ -277,9 +449,23 @@ interface EC2CategoryPageData {
   security_specifications?: RawRow[]
 }
 
+type EC2InstanceSection = Exclude<
+  keyof EC2CategoryPageData,
+  'instance_family_summary'
+>
+
+type EC2InstanceSections = Partial<Record<EC2InstanceSection, RawRow>>
+
+const EC2_INSTANCE_SECTIONS: EC2InstanceSection[] = [
+  'performance_specifications',
+  'network_specifications',
+  'ebs_specifications',
+  'instance_store_specifications',
+  'security_specifications',
+]
+
 function parseCategoryPage(html: string): EC2CategoryPageData {
-  const root = parse(html)
-  const tables = root.querySelectorAll('table')
+  const tables = parseTables(html, EC2_TABLE)
 
   const sectionNames: (string | null)[] = [
     null, // Skip first table (instance families and types list)
@@ -293,11 +479,10 @@ function parseCategoryPage(html: string): EC2CategoryPageData {
 
   const data: EC2CategoryPageData = {}
   for (let i = 0; i < tables.length; i++) {
-    const table = tables[i]
-    if (!table) continue
+    const parsed = tables[i]
+    if (!parsed) continue
     const sectionName = i < sectionNames.length ? sectionNames[i] : `table_${i}`
     if (!sectionName) continue
-    const parsed = parseTable(table.outerHTML)
     if (parsed.length) {
       ;(data as Record<string, RawRow[]>)[sectionName] = parsed
     }
@@ -311,6 +496,15 @@ function getRawStr(row: RawRow, key: string): string {
   return v !== undefined && v !== null ? String(v) : ''
 }
 
+// Returns the first non-empty value among alternative header spellings
+function getFirstRawStr(row: RawRow, ...keys: string[]): string {
+  for (const key of keys) {
+    const v = getRawStr(row, key)
+    if (v) return v
+  }
+  return ''
+}
+
 function getRawNum(row: RawRow, key: string, fallback: number): number {
   const v = row[key]
   if (typeof v === 'number') return v
@@ -438,6 +632,8 @@ function processCategoryData(
   rawData: EC2CategoryPageData,
   category: string,
 ): EC2InstanceDetails[] {
+  const intern = createInterner()
+
   // Build lookup tables
   const familySummaries: Record<string, RawRow> = {}
   for (const item of rawData.instance_family_summary ?? []) {
@@ -447,60 +643,56 @@ function processCategoryData(
     }
   }
 
-  const performance: Record<string, RawRow> = {}
-  for (const item of rawData.performance_specifications ?? []) {
-    const it = getRawAny(item, 'instance_type')
-    if (it && typeof it === 'string') performance[it] = item
-  }
-
-  const network: Record<string, RawRow> = {}
-  for (const item of rawData.network_specifications ?? []) {
-    const it = getRawAny(item, 'instance_type')
-    if (it && typeof it === 'string') network[it] = item
-  }
-
-  const ebs: Record<string, RawRow> = {}
-  for (const item of rawData.ebs_specifications ?? []) {
-    const it = getRawAny(item, 'instance_type')
-    if (it && typeof it === 'string') ebs[it] = item
-  }
-
-  const instanceStore: Record<string, RawRow> = {}
-  for (const item of rawData.instance_store_specifications ?? []) {
-    const it = getRawAny(item, 'instance_type')
-    if (it && typeof it === 'string') instanceStore[it] = item
+  // Lowercase index for the case-insensitive family fallback; the first
+  // matching family wins, as with the linear scan it replaces
+  const familySummariesByLower = new Map<string, [string, RawRow]>()
+  for (const [fname, fsummary] of Object.entries(familySummaries)) {
+    const key = fname.toLowerCase()
+    if (!familySummariesByLower.has(key)) {
+      familySummariesByLower.set(key, [fname, fsummary])
+    }
   }
 
-  const security: Record<string, RawRow> = {}
-  for (const item of rawData.security_specifications ?? []) {
-    const it = getRawAny(item, 'instance_type')
-    if (it && typeof it === 'string') security[it] = item
+  // Merge the per-instance sections into one record per instance type.
+  // Performance rows go first so instance order follows that table.
+  const sectionsByType = new Map<string, EC2InstanceSections>()
+  for (const section of EC2_INSTANCE_SECTIONS) {
+    for (const item of rawData[section] ?? []) {
+      const it = getRawAny(item, 'instance_type')
+      if (!it || typeof it !== 'string') continue
+      let sections = sectionsByType.get(it)
+      if (!sections) {
+        sections = {}
+        sectionsByType.set(it, sections)
+      }
+      sections[section] = item
+    }
   }
 
   const instances: EC2InstanceDetails[] = []
 
-  for (const instanceType of Object.keys(performance)) {
+  for (const [instanceType, sections] of sectionsByType) {
+    const perf = sections.performance_specifications
+    if (!perf) continue
+
     let familyName = extractFamilyFromInstanceType(instanceType)
     let familySummary = familySummaries[familyName] ?? null
 
     // Try case-insensitive match if not found
     if (!familySummary) {
-      for (const [fname, fsummary] of Object.entries(familySummaries)) {
-        if (fname.toLowerCase() === familyName.toLowerCase()) {
-          familySummary = fsummary
-          familyName = fname
-          break
-        }
+      const match = familySummariesByLower.get(familyName.toLowerCase())
+      if (match) {
+        familyName = match[0]
+        familySummary = match[1]
       }
     }
 
     if (!familySummary) familySummary = {}
 
-    const perf = performance[instanceType] ?? {}
-    const netRaw = network[instanceType] ?? {}
-    const ebsRaw = ebs[instanceType] ?? {}
-    const storeRaw = instanceStore[instanceType] ?? null
-    const secRaw = security[instanceType] ?? {}
+    const netRaw = sections.network_specifications ?? {}
+    const ebsRaw = sections.ebs_specifications ?? {}
+    const storeRaw = sections.instance_store_specifications ?? null
+    const secRaw = sections.security_specifications ?? {}
 
     // Operating systems
     let operatingSystems: string[] = []
@@ -526,12 +718,11 @@ function processCategoryData(
 
     instances.push({
       instanceType,
-      family: familyName,
+      family: intern(familyName),
       category,
-      hypervisor: getRawStr(familySummary, 'hypervisor'),
-      processorArchitecture: getRawStr(
-        familySummary,
-        'processor_type_architecture',
+      hypervisor: intern(getRawStr(familySummary, 'hypervisor')),
+      processorArchitecture: intern(
+        getRawStr(familySummary, 'processor_type_architecture'),
       ),
       metalAvailable: getRawBool(familySummary, 'metal_instances_available'),
       dedicatedHosts: getRawBool(familySummary, 'dedicated_hosts_support'),
@@ -539,7 +730,7 @@ function processCategoryData(
       hibernation: getRawBool(familySummary, 'hibernation_support'),
       operatingSystems,
       memoryGiB: getRawNum(perf, 'memory_gib', 0),
-      processor: getRawStr(perf, 'processor'),
+      processor: intern(getRawStr(perf, 'processor')),
       vCPUs: getRawInt(perf, 'vcpus', 0),
       cpuCores: getRawInt(perf, 'cpu_cores', 0),
       threadsPerCore: getRawInt(perf, 'threads_per_core', 1),
@@ -557,75 +748,34 @@ function processCategoryData(
 
 // === RDS Parsing ===
 
-function parseRDSTable(tableHtml: string): RawRow[] {
-  const root = parse(tableHtml)
-  const table = root.querySelector('table') ?? root
-
-  const headers: string[] = []
-  const thead = table.querySelector('thead')
-  if (thead) {
-    for (const th of thead.querySelectorAll('th')) {
-      headers.push(toSnakeCase(cleanText(th.text)))
-    }
-  }
-
-  const rows: RawRow[] = []
-  const tbody = table.querySelector('tbody') ?? table
-  const trs = tbody.querySelectorAll('tr')
-  for (let ri = 0; ri < trs.length; ri++) {
-    const tr = trs[ri]
-    if (!tr) continue
-    const cells = tr.querySelectorAll('td')
-    if (!cells.length) continue
-
-    const rowData: RawRow = {}
-    for (let i = 0; i < cells.length; i++) {
-      const cell = cells[i]
-      if (!cell) continue
-      let value: BasicValue = cleanText(cell.text)
-      const header =
-        i < headers.length ? (headers[i] ?? `column_${i}`) : `column_${i}`
-
-      if (header === 'instance_class' && typeof value === 'string') {
-        value = value.replace(/[*]+$/, '').trim()
-      }
-      rowData[header] = value
-    }
-
-    if (getRawAny(rowData, 'instance_class')) {
-      rows.push(rowData)
-    }
-  }
-
-  return rows
+function stripThousandsSeparators(value: string): string {
+  return value.replaceAll(',', '')
 }
 
 function processRDSData(rawInstances: RawRow[]): RDSInstanceDetails[] {
+  const intern = createInterner()
   const instances: RDSInstanceDetails[] = []
 
   for (const raw of rawInstances) {
     const instanceClass = getRawStr(raw, 'instance_class')
     if (!instanceClass || !instanceClass.startsWith('db.')) continue
 
-    const family = extractRDSFamily(instanceClass)
+    const family = intern(extractRDSFamily(instanceClass))
     const category = determineRDSCategory(family)
 
-    const vcpusRaw = getRawStr(raw, 'vcpu') || getRawStr(raw, 'vcpus') || '0'
+    const vcpusRaw = getFirstRawStr(raw, 'vcpu', 'vcpus')
     const vCPUs = Number.parseInt(vcpusRaw, 10) || 0
 
-    const memRawStr = (
-      getRawStr(raw, 'memory_gib') ||
-      getRawStr(raw, 'memory') ||
-      '0'
-    ).replace(/,/g, '')
-    const memoryGiB = Number.parseFloat(memRawStr) || 0
+    const memRawStr = getFirstRawStr(raw, 'memory_gib', 'memory')
+    const memoryGiB =
+      Number.parseFloat(stripThousandsSeparators(memRawStr)) || 0
 
-    const networkBandwidthGbps =
-      getRawStr(raw, 'network_bandwidth_gbps') ||
-      getRawStr(raw, 'network_bandwidth')
-    const ebsBandwidthMbps =
-      getRawStr(raw, 'max_ebs_bandwidth_mbps') ||
-      getRawStr(raw, 'ebs_bandwidth')
+    const networkBandwidthGbps = intern(
+      getFirstRawStr(raw, 'network_bandwidth_gbps', 'network_bandwidth'),
+    )
+    const ebsBandwidthMbps = intern(
+      getFirstRawStr(raw, 'max_ebs_bandwidth_mbps', 'ebs_bandwidth'),
+    )
 
     instances.push({
       instanceClass,
@@ -643,91 +793,49 @@ function processRDSData(rawInstances: RawRow[]): RDSInstanceDetails[] {
 
 // === ElastiCache Parsing ===
 
-function parseElastiCacheTable(tableHtml: string): RawRow[] {
-  const root = parse(tableHtml)
-  const table = root.querySelector('table') ?? root
-
-  const headers: string[] = []
-  const thead = table.querySelector('thead')
-  if (thead) {
-    for (const th of thead.querySelectorAll('th')) {
-      headers.push(toSnakeCase(cleanText(th.text)))
-    }
-  }
-
-  const rows: RawRow[] = []
-  const tbody = table.querySelector('tbody') ?? table
-  const trs = tbody.querySelectorAll('tr')
-  for (let ri = 0; ri < trs.length; ri++) {
-    const tr = trs[ri]
-    if (!tr) continue
-    const cells = tr.querySelectorAll('td')
-    if (!cells.length) continue
-
-    const rowData: RawRow = {}
-    for (let i = 0; i < cells.length; i++) {
-      const cell = cells[i]
-      if (!cell) continue
-      let value: BasicValue = cleanText(cell.text)
-      const header =
-        i < headers.length ? (headers[i] ?? `column_${i}`) : `column_${i}`
-
-      if (
-        (header === 'node_type' || header === 'instance_type') &&
-        typeof value === 'string'
-      ) {
-        value = value.replace(/[*]+$/, '').trim()
-      }
-      rowData[header] = value
-    }
-
-    const nodeType =
-      getRawStr(rowData, 'node_type') || getRawStr(rowData, 'instance_type')
-    if (nodeType.startsWith('cache.')) {
-      rowData.node_type = nodeType
-      rows.push(rowData)
-    }
-  }
-
-  return rows
+// Some ElastiCache tables label the node type column "Instance type"
+function elastiCacheNodeType(row: RawRow): string {
+  return getFirstRawStr(row, 'node_type', 'instance_type')
 }
 
 function processElastiCacheData(rawNodes: RawRow[]): ElastiCacheNodeDetails[] {
+  const intern = createInterner()
   const seen = new Set<string>()
   const nodes: ElastiCacheNodeDetails[] = []
 
   for (const raw of rawNodes) {
-    const nodeType = getRawStr(raw, 'node_type')
+    const nodeType = elastiCacheNodeType(raw)
     if (!nodeType || !nodeType.startsWith('cache.')) continue
     if (seen.has(nodeType)) continue
     seen.add(nodeType)
 
-    const family = extractElastiCacheFamily(nodeType)
+    const family = intern(extractElastiCacheFamily(nodeType))
     const category = determineElastiCacheCategory(family)
 
     let vCPUs: number | null = null
-    const vcpusStr = getRawStr(raw, 'vcpus') || getRawStr(raw, 'vcpu')
+    const vcpusStr = getFirstRawStr(raw, 'vcpus', 'vcpu')
     if (vcpusStr) {
       const parsed = Number.parseInt(vcpusStr, 10)
       if (!Number.isNaN(parsed)) vCPUs = parsed
     }
 
     let memoryGiB: number | null = null
-    const memStr = (
-      getRawStr(raw, 'memory_gib') || getRawStr(raw, 'memory')
-    ).replace(/,/g, '')
+    const memStr = stripThousandsSeparators(
+      getFirstRawStr(raw, 'memory_gib', 'memory'),
+    )
     if (memStr) {
       const parsed = Number.parseFloat(memStr)
       if (!Number.isNaN(parsed)) memoryGiB = parsed
     }
 
-    const networkPerformance = getRawStr(raw, 'network_performance')
+    const networkPerformance = intern(getRawStr(raw, 'network_performance'))
 
-    const baselineStr =
-      getRawStr(raw, 'baseline_bandwidth_gbps') ||
-      getRawStr(raw, 'baseline_gbps')
-    const burstStr =
-      getRawStr(raw, 'burst_bandwidth_gbps') || getRawStr(raw, 'burst_gbps')
+    const baselineStr = intern(
+      getFirstRawStr(raw, 'baseline_bandwidth_gbps', 'baseline_gbps'),
+    )
+    const burstStr = intern(
+      getFirstRawStr(raw, 'burst_bandwidth_gbps', 'burst_gbps'),
+    )
 
     nodes.push({
       nodeType,
@@ -746,12 +854,58 @@ function processElastiCacheData(rawNodes: RawRow[]): ElastiCacheNodeDetails[] {
 
 // === HTTP Fetch ===
 
+function cachePathFor(url: string): string {
+  const key = createHash('sha256').update(url).digest('hex')
+  return join(AWS_DOCS_CACHE_DIR, `${key}.html`)
+}
+
+async function readCachedHTML(url: string): Promise<string | null> {
+  if (!AWS_DOCS_CACHE_DIR) return null
+  const path = cachePathFor(url)
+  try {
+    const { mtimeMs } = await stat(path)
+    if (Date.now() - mtimeMs > AWS_DOCS_CACHE_TTL * 1000) return null
+    const html = await readFile(path, 'utf-8')
+    // An empty page is never a valid response; re-fetch it
+    return html || null
+  } catch {
+    return null
+  }
+}
+
+// Created once and shared by later writes. Any failed write forgets it, so
+// the next write retries mkdir (e.g. if the directory was removed meanwhile)
+let cacheDirReady: Promise<unknown> | null = null
+
+async function writeCachedHTML(url: string, html: string): Promise<void> {
+  if (!AWS_DOCS_CACHE_DIR) return
+  const path = cachePathFor(url)
+  // Write beside the target and rename over it, so readers (possibly other
+  // processes sharing the directory) never see a partially written page
+  const tmpPath = `${path}.${randomUUID()}.tmp`
+  try {
+    cacheDirReady ??= mkdir(AWS_DOCS_CACHE_DIR, { recursive: true })
+    await cacheDirReady
+    await writeFile(tmpPath, html)
+    await rename(tmpPath, path)
+  } catch {
+    // The disk cache is best-effort; an unwritable directory is not fatal
+    cacheDirReady = null
+    await rm(tmpPath, { force: true }).catch(() => undefined)
+  }
+}
+
 async function fetchHTML(url: string): Promise<string> {
+  const cached = await readCachedHTML(url)
+  if (cached !== null) return cached
+
   const res = await fetch(url)
   if (!res.ok) {
     throw new Error(`Failed to fetch AWS docs: ${url} (status: ${res.status})`)
   }
-  return res.text()
+  const html = await res.text()
+  await writeCachedHTML(url, html)
+  return html
 }
 
 // === Public API ===
@@ -785,13 +939,7 @@ export async function fetchAllEC2(): Promise<EC2InstanceDetails[]> {
  */
 export async function fetchRDSInstances(): Promise<RDSInstanceDetails[]> {
   const html = await fetchHTML(RDS_URL)
-  const root = parse(html)
-  const tables = root.querySelectorAll('table')
-  const allRows: RawRow[] = []
-  for (const table of tables) {
-    allRows.push(...parseRDSTable(table.outerHTML))
-  }
-  return processRDSData(allRows)
+  return processRDSData(parseTables(html, RDS_TABLE).flat())
 }
 
 /**
@@ -801,11 +949,5 @@ export async function fetchElastiCacheNodes(): Promise<
   ElastiCacheNodeDetails[]
 > {
   const html = await fetchHTML(ELASTICACHE_URL)
-  const root = parse(html)
-  const tables = root.querySelectorAll('table')
-  const allRows: RawRow[] = []
-  for (const table of tables) {
-    allRows.push(...parseElastiCacheTable(table.outerHTML))
-  }
-  return processElastiCacheData(allRows)
+  return processElastiCacheData(parseTables(html, ELASTICACHE_TABLE).flat())
 }
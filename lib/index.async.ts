@@ -20,7 +20,7 @@ export type {
   ElastiCacheInfo,
 } from './types.js'
 
-// Re-export cache size constants
+// Re-export cache configuration constants
 export {
   EC2_INSTANCE_CACHE_SIZE,
   EC2_FAMILY_CACHE_SIZE,
@@ -28,6 +28,8 @@ export {
   RDS_FAMILY_CACHE_SIZE,
   ELASTICACHE_NODE_CACHE_SIZE,
   ELASTICACHE_FAMILY_CACHE_SIZE,
+  AWS_DOCS_CACHE_DIR,
+  AWS_DOCS_CACHE_TTL,
 } from './constants.js'
 
 // Re-export all async EC2 functions
@@ -40,15 +40,12 @@ async function ensureInitialized(): Promise<void> {
   initPromise = (async () => {
     const all = await fetchRDSInstances()
 
-    // Populate instance cache and full map
+    // Populate instance cache and full map, and build family data in one pass
+    const builtFamilyMap = new Map<string, RDSFamilyData>()
     for (const instance of all) {
       instanceCache.set(instance.instanceClass, instance)
       instanceMap.set(instance.instanceClass, instance)
-    }
 
-    // Build family data from instances
-    const builtFamilyMap = new Map<string, RDSFamilyData>()
-    for (const instance of all) {
       const { family, category } = instance
       let fd = builtFamilyMap.get(family)
       if (!fd) {
@@ -1,6 +1,8 @@
-import { describe, expect, it } from 'vitest'
+import { afterEach, describe, expect, it, vi } from 'vitest'
 
 import {
+  AWS_DOCS_CACHE_DIR,
+  AWS_DOCS_CACHE_TTL,
   EC2_FAMILY_CACHE_SIZE,
   EC2_INSTANCE_CACHE_SIZE,
   ELASTICACHE_FAMILY_CACHE_SIZE,
@@ -82,6 +84,32 @@ describe('Constants Module', () => {
     })
   })
 
+  describe('AWS Docs Cache Constants', () => {
+    it('AWS_DOCS_CACHE_DIR should default to disabled', () => {
+      // Empty string disables the on-disk page cache
+      expect(AWS_DOCS_CACHE_DIR).toBe('')
+    })
+
+    it('AWS_DOCS_CACHE_TTL should default to 86400', () => {
+      // Default value when env var is not set
+      expect(AWS_DOCS_CACHE_TTL).toBe(86400)
+    })
+
+    describe('with a non-numeric AWS_DOCS_CACHE_TTL', () => {
+      afterEach(() => {
+        vi.unstubAllEnvs()
+        vi.resetModules()
+      })
+
+      it('AWS_DOCS_CACHE_TTL should fall back to 86400', async () => {
+        vi.stubEnv('AWS_DOCS_CACHE_TTL', 'one-day')
+        vi.resetModules()
+        const constants = await import('../lib/constants.js')
+        expect(constants.AWS_DOCS_CACHE_TTL).toBe(86400)
+      })
+    })
+  })
+
   describe('Cache Size Relationships', () => {
     it('instance/node cache sizes should be larger than family cache sizes', () => {
       expect(EC2_INSTANCE_CACHE_SIZE).toBeGreaterThanOrEqual(
@@ -1,4 +1,14 @@
-import { describe, expect, it } from 'vitest'
+import {
+  mkdtempSync,
+  readFileSync,
+  readdirSync,
+  rmSync,
+  utimesSync,
+  writeFileSync,
+} from 'node:fs'
+import { tmpdir } from 'node:os'
+import { join } from 'node:path'
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest'
 
 import {
   EC2_CATEGORIES,
@@ -16,10 +26,30 @@ import {
   fetchElastiCacheNodes,
   fetchRDSInstances,
 } from '../lib/fetch.js'
+import { fixture } from './setup.js'
 
 // MSW is set up in tests/setup.ts via vitest setupFiles — all 8 URLs are intercepted
 
+// Serve a hand-edited page for every fetch; restored after each test
+function servePage(html: string): void {
+  const respond = async () => new Response(html)
+  vi.spyOn(globalThis, 'fetch').mockImplementation(respond)
+}
+
+// A docs page holding a single table with the given header labels and cells
+function tablePage(headers: string[], rows: string[][]): string {
+  const head = headers.map(header => `<th>${header}</th>`).join('')
+  const body = rows
+    .map(row => `<tr>${row.map(cell => `<td>${cell}</td>`).join('')}</tr>`)
+    .join('')
+  return `<table><thead><tr>${head}</tr></thead><tbody>${body}</tbody></table>`
+}
+
 describe('fetch.ts', () => {
+  afterEach(() => {
+    vi.restoreAllMocks()
+  })
+
   // === URL / Category constants ===
 
   describe('EC2_CATEGORIES', () => {
@@ -239,6 +269,29 @@ describe('fetch.ts', () => {
       expect(types).toContain('p3.2xlarge')
       expect(types).toContain('hpc6a.48xlarge')
     })
+
+    it('should request all category pages concurrently', async () => {
+      const originalFetch = globalThis.fetch
+      let requests = 0
+      let inFlight = 0
+      let maxInFlight = 0
+      vi.spyOn(globalThis, 'fetch').mockImplementation(async (...args) => {
+        requests++
+        inFlight++
+        maxInFlight = Math.max(maxInFlight, inFlight)
+        try {
+          return await originalFetch(...args)
+        } finally {
+          inFlight--
+        }
+      })
+
+      await fetchAllEC2()
+
+      const categoryCount = Object.keys(EC2_CATEGORIES).length
+      expect(requests).toBe(categoryCount)
+      expect(maxInFlight).toBe(categoryCount)
+    })
   })
 
   describe('fetchRDSInstances', () => {
@@ -293,6 +346,26 @@ describe('fetch.ts', () => {
         expect(inst.instanceClass.startsWith('db.')).toBe(true)
       }
     })
+
+    it('should accept alternate RDS column headers', async () => {
+      servePage(
+        tablePage(
+          [
+            'Instance class',
+            'vCPUs',
+            'Memory',
+            'Network bandwidth',
+            'EBS bandwidth',
+          ],
+          [['db.x2g.16xlarge', '64', '1,024', '25', '19,000']],
+        ),
+      )
+      const [instance] = await fetchRDSInstances()
+      expect(instance?.vCPUs).toBe(64)
+      expect(instance?.memoryGiB).toBe(1024)
+      expect(instance?.networkBandwidthGbps).toBe('25')
+      expect(instance?.ebsBandwidthMbps).toBe('19,000')
+    })
   })
 
   describe('fetchElastiCacheNodes', () => {
@@ -349,6 +422,38 @@ describe('fetch.ts', () => {
       }
     })
 
+    it('should read node types from an "Instance type" column', async () => {
+      servePage(
+        tablePage(
+          ['Instance type', 'vCPUs', 'Memory (GiB)'],
+          [
+            ['cache.m7g.large*', '2', '6.38'],
+            ['m7g.large', '2', '8'],
+          ],
+        ),
+      )
+      const nodes = await fetchElastiCacheNodes()
+      // Footnote stars are stripped and non-cache. rows are dropped
+      expect(nodes.map(n => n.nodeType)).toEqual(['cache.m7g.large'])
+      expect(nodes[0]?.family).toBe('M7g')
+      expect(nodes[0]?.vCPUs).toBe(2)
+      expect(nodes[0]?.memoryGiB).toBe(6.38)
+    })
+
+    it('should accept alternate ElastiCache column headers', async () => {
+      servePage(
+        tablePage(
+          ['Node type', 'vCPU', 'Memory', 'Baseline (Gbps)', 'Burst (Gbps)'],
+          [['cache.r7g.16xlarge', '64', '1,022.4', '25', '30']],
+        ),
+      )
+      const [node] = await fetchElastiCacheNodes()
+      expect(node?.vCPUs).toBe(64)
+      expect(node?.memoryGiB).toBe(1022.4)
+      expect(node?.baselineBandwidthGbps).toBe('25')
+      expect(node?.burstBandwidthGbps).toBe('30')
+    })
+
     it('should not have duplicate node types', async () => {
       const nodes = await fetchElastiCacheNodes()
       const types = nodes.map(n => n.nodeType)
@@ -356,4 +461,115 @@ describe('fetch.ts', () => {
       expect(unique.size).toBe(types.length)
     })
   })
+
+  describe('page table scanning', () => {
+    it('should ignore tables inside comments and script/style text', async () => {
+      const url = EC2_CATEGORIES.general_purpose ?? ''
+      const expected = await fetchEC2Category('general_purpose', url)
+
+      // EC2 sections are mapped by table index, so a stray table would shift
+      // every section after it
+      servePage(
+        fixture('ec2-general_purpose.html').replace(
+          '<body>',
+          `<body>
+<!-- <table><tbody><tr><td>old</td><td>table</td></tr></tbody></table> -->
+<script>var markup = "<table><tr><td>x</td></tr>"</script>
+<style>/* <table> */</style>`,
+        ),
+      )
+      const instances = await fetchEC2Category('general_purpose', url)
+      expect(instances).toEqual(expected)
+    })
+
+    it('should keep rows after a nested table in the same block', async () => {
+      const expected = await fetchRDSInstances()
+
+      servePage(
+        fixture('rds.html').replace(
+          '<tbody>',
+          `<tbody>
+    <tr><td><table><tbody><tr><td>Note</td></tr></tbody></table></td></tr>`,
+        ),
+      )
+      const instances = await fetchRDSInstances()
+      expect(instances).toEqual(expected)
+    })
+
+    it('should parse a trailing table that is never closed', async () => {
+      const expected = await fetchElastiCacheNodes()
+
+      servePage(fixture('elasticache.html').replace(/<\/tbody>[\s\S]*$/, ''))
+      const nodes = await fetchElastiCacheNodes()
+      expect(nodes).toEqual(expected)
+    })
+  })
+
+  describe('on-disk page cache', () => {
+    let cacheDir: string
+
+    // AWS_DOCS_CACHE_DIR is read at import time, so load a fresh module copy
+    beforeEach(() => {
+      cacheDir = mkdtempSync(join(tmpdir(), 'aws-docs-cache-'))
+      vi.stubEnv('AWS_DOCS_CACHE_DIR', cacheDir)
+      vi.resetModules()
+    })
+
+    afterEach(() => {
+      vi.unstubAllEnvs()
+      vi.resetModules()
+      rmSync(cacheDir, { recursive: true, force: true })
+    })
+
+    it('should serve repeat fetches from disk without hitting the network', async () => {
+      const cached = await import('../lib/fetch.js')
+      const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      const first = await cached.fetchRDSInstances()
+      const second = await cached.fetchRDSInstances()
+      expect(fetchSpy).toHaveBeenCalledTimes(1)
+      expect(second).toEqual(first)
+      expect(readdirSync(cacheDir)).toHaveLength(1)
+    })
+
+    it('should re-fetch pages older than AWS_DOCS_CACHE_TTL', async () => {
+      const cached = await import('../lib/fetch.js')
+      await cached.fetchRDSInstances()
+
+      const stale = new Date(Date.now() - 2 * 86400 * 1000)
+      for (const file of readdirSync(cacheDir)) {
+        utimesSync(join(cacheDir, file), stale, stale)
+      }
+
+      const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      await cached.fetchRDSInstances()
+      expect(fetchSpy).toHaveBeenCalledTimes(1)
+    })
+
+    it('should recreate the cache directory if it is removed', async () => {
+      const cached = await import('../lib/fetch.js')
+      await cached.fetchRDSInstances()
+      rmSync(cacheDir, { recursive: true, force: true })
+
+      // The first write after removal fails and resets the memoised mkdir
+      await cached.fetchElastiCacheNodes()
+      await cached.fetchElastiCacheNodes()
+      expect(readdirSync(cacheDir)).toHaveLength(1)
+    })
+
+    it('should re-fetch and replace an empty cached page', async () => {
+      const cached = await import('../lib/fetch.js')
+      const expected = await cached.fetchRDSInstances()
+
+      // Simulate a page truncated by an interrupted write
+      const [file = ''] = readdirSync(cacheDir)
+      writeFileSync(join(cacheDir, file), '')
+
+      const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      expect(await cached.fetchRDSInstances()).toEqual(expected)
+      expect(fetchSpy).toHaveBeenCalledTimes(1)
+      // Replaced by rename, leaving no temporary files behind
+      expect(readdirSync(cacheDir)).toEqual([file])
+      expect(readFileSync(join(cacheDir, file), 'utf-8')).not.toBe('')
+    })
+  })
 })
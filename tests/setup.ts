@@ -9,7 +9,7 @@ const __filename = fileURLToPath(import.meta.url)
 const __dirname = dirname(__filename)
 const FIXTURES_DIR = join(__dirname, 'fixtures')
 
-function fixture(name: string): string {
+export function fixture(name: string): string {
   return readFileSync(join(FIXTURES_DIR, name), 'utf-8')
 }
 